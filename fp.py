@@ -1,7 +1,14 @@
 import pygame
 import random
 import math
-from typing import List, Tuple
+import numpy as np
+from collections import defaultdict, deque
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 pygame.init()
 
@@ -10,7 +17,10 @@ WINDOW_HEIGHT = 600
 BOX_WIDTH = 400
 BOX_HEIGHT = 300
 PARTICLE_RADIUS = 5
+COLLISION_DIST = 2 * PARTICLE_RADIUS
+COLLISION_DIST_SQ = COLLISION_DIST ** 2
 NUM_PARTICLES = 50
+RNG_SEED = 42
 MIN_SPEED = 1
 MAX_SPEED = 5
 TEMPERATURE_FACTOR = 0.5
@@ -46,6 +56,9 @@ class Button:
         self.font = pygame.font.Font(None, 36)
         self.label = label
         self.label_font = pygame.font.Font(None, 24)
+        #text never changes so render it once, arrows are drawn as polygons
+        self.text_surface = None if text in ["↑", "↓"] else self.font.render(text, True, dark_color).convert_alpha()
+        self.label_surface = self.label_font.render(label, True, BLACK).convert_alpha() if label else None
 
     def draw(self, screen):
         shadow_rect = self.rect.copy()
@@ -79,20 +92,21 @@ class Button:
             
             pygame.draw.polygon(screen, self.dark_color, points)
         else:
-            text_surface = self.font.render(self.text, True, self.dark_color)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
-        
-        if self.label:
-            label_surface = self.label_font.render(self.label, True, BLACK)
-            label_rect = label_surface.get_rect(centerx=self.rect.centerx, top=self.rect.bottom + 5)
-            screen.blit(label_surface, label_rect)
+            text_rect = self.text_surface.get_rect(center=self.rect.center)
+            screen.blit(self.text_surface, text_rect)
+
+        if self.label_surface:
+            label_rect = self.label_surface.get_rect(centerx=self.rect.centerx, top=self.rect.bottom + 5)
+            screen.blit(self.label_surface, label_rect)
 
     def is_clicked(self, pos) -> bool:
         self.is_hovered = self.rect.collidepoint(pos)
         return self.is_hovered
 
+#scalar reference version, the simulator itself works on the numpy arrays below
 class Particle:
+    __slots__ = ('x', 'y', 'dx', 'dy', 'mass')
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -102,29 +116,29 @@ class Particle:
         self.dy = speed * math.sin(angle)
         self.mass = PARTICLE_MASS
         
-    def move(self, box_x: float, box_y: float, box_width: float, box_height: float):
+    def move(self, x_min: float, x_max: float, y_min: float, y_max: float):
         new_x = self.x + self.dx
         new_y = self.y + self.dy
 
-        if new_x - PARTICLE_RADIUS < box_x:
-            new_x = box_x + PARTICLE_RADIUS
+        if new_x < x_min:
+            new_x = x_min
             self.dx = abs(self.dx)
-        elif new_x + PARTICLE_RADIUS > box_x + box_width:
-            new_x = box_x + box_width - PARTICLE_RADIUS
+        elif new_x > x_max:
+            new_x = x_max
             self.dx = -abs(self.dx)
-            
-        if new_y - PARTICLE_RADIUS < box_y:
-            new_y = box_y + PARTICLE_RADIUS
+
+        if new_y < y_min:
+            new_y = y_min
             self.dy = abs(self.dy)
-        elif new_y + PARTICLE_RADIUS > box_y + box_height:
-            new_y = box_y + box_height - PARTICLE_RADIUS
+        elif new_y > y_max:
+            new_y = y_max
             self.dy = -abs(self.dy)
-        
+
         self.x = new_x
         self.y = new_y
         
     def get_speed(self) -> float:
-        return math.sqrt(self.dx**2 + self.dy**2)
+        return math.hypot(self.dx, self.dy)
     
     def set_speed(self, factor: float):
         current_speed = self.get_speed()
@@ -137,27 +151,139 @@ class Particle:
         speed = self.get_speed()
         return 0.5 * self.mass * speed**2
 
+#whole physics frame (integrate, wall bounce, pair collisions) as one
+#compiled kernel, the explicit loops are what numba autovectorizes best
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _physics_step(px, py, vx, vy, x_min, x_max, y_min, y_max):
+        n = px.shape[0]
+        collisions = 0
+        for i in range(n):
+            px[i] += vx[i]
+            py[i] += vy[i]
+            if px[i] <= x_min:
+                px[i] = x_min
+                vx[i] = abs(vx[i])
+                collisions += 1
+            elif px[i] >= x_max:
+                px[i] = x_max
+                vx[i] = -abs(vx[i])
+                collisions += 1
+            if py[i] <= y_min:
+                py[i] = y_min
+                vy[i] = abs(vy[i])
+                collisions += 1
+            elif py[i] >= y_max:
+                py[i] = y_max
+                vy[i] = -abs(vy[i])
+                collisions += 1
+
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = px[j] - px[i]
+                dy = py[j] - py[i]
+                d_sq = dx * dx + dy * dy
+                if d_sq < COLLISION_DIST_SQ:
+                    vx[i], vx[j] = vx[j], vx[i]
+                    vy[i], vy[j] = vy[j], vy[i]
+
+                    #same coincident-pair guard as handle_collisions, fastmath
+                    #makes the behaviour of a zero division undefined
+                    if d_sq > 0.0:
+                        d = math.sqrt(d_sq)
+                        inv_d = 1.0 / d
+                        ux = dx * inv_d
+                        uy = dy * inv_d
+                        overlap = COLLISION_DIST - d
+                    else:
+                        ux = 1.0
+                        uy = 0.0
+                        overlap = COLLISION_DIST
+                    px[i] -= overlap * ux / 2
+                    py[i] -= overlap * uy / 2
+                    px[j] += overlap * ux / 2
+                    py[j] += overlap * uy / 2
+
+        return collisions
+else:
+    _physics_step = None
+
 class GasSimulator:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Kinetic Gas Simulator")
         self.clock = pygame.time.Clock()
-        self.particles: List[Particle] = []
-        self.temperature = 1.0  
+        self.rng = np.random.default_rng(RNG_SEED)
+        self.temperature = 1.0
         self.collisions = 0
-        self.pressure_history: List[int] = []
+        self.pressure_history = deque(maxlen=60)
+        self._pressure_sum = 0
         self.font = pygame.font.Font(None, 36)
+        self._text_cache = {}
+        self._stats_surface = None
+        self._stats_counter = 0
         self.window_width = WINDOW_WIDTH
         self.window_height = WINDOW_HEIGHT
         self.box_scale = 0.8
+        self._box_cache = None
         self.pressure_unit = "Pa"
         self.speed_unit = "m/s"
         self.energy_unit = "J"
         self.temp_unit = "T"  
         
         self.update_button_positions()
+        self._build_particle_sprite()
+        self._rebuild_background()
         self.initialize_particles()
-        
+
+    def _build_particle_sprite(self):
+        #glow + body baked into one sprite, blitted per particle in draw
+        #the rings fade out through the alpha channel instead of opaque overdraw
+        half = PARTICLE_RADIUS + 3
+        size = 2 * half + 1
+        self.particle_sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.sprite_offset = half
+        glow_color = (BLUE[0]//2, BLUE[1]//2, BLUE[2]//2)
+        for i in range(3, 0, -1):
+            pygame.draw.circle(self.particle_sprite, (*glow_color, 80 // i),
+                               (half, half), PARTICLE_RADIUS + i)
+        pygame.draw.circle(self.particle_sprite, BLUE, (half, half), PARTICLE_RADIUS)
+        #match the display pixel format so blits skip per-pixel conversion
+        self.particle_sprite = self.particle_sprite.convert_alpha()
+
+    def _rebuild_background(self):
+        #container and walls only change on resize/box adjust, render once
+        box_width, box_height, box_x, box_y = self.get_box_dimensions()
+
+        self.background = pygame.Surface((self.window_width, self.window_height)).convert()
+        self.background.fill(WHITE)
+
+        shadow_rect = pygame.Rect(
+            box_x + CONTAINER_SHADOW_SIZE,
+            box_y + CONTAINER_SHADOW_SIZE,
+            box_width,
+            box_height
+        )
+        pygame.draw.rect(self.background, CONTAINER_SHADOW, shadow_rect, border_radius=10)
+
+        for i in range(WALL_THICKNESS):
+            border_rect = pygame.Rect(
+                box_x - i,
+                box_y - i,
+                box_width + 2*i,
+                box_height + 2*i
+            )
+            gradient_factor = 1 - (i / WALL_THICKNESS) * 0.3
+            border_color = (
+                int(CONTAINER_BORDER[0] * gradient_factor),
+                int(CONTAINER_BORDER[1] * gradient_factor),
+                int(CONTAINER_BORDER[2] * gradient_factor)
+            )
+            pygame.draw.rect(self.background, border_color, border_rect, 1, border_radius=10)
+
+        container_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+        pygame.draw.rect(self.background, CONTAINER_COLOR, container_rect, border_radius=10)
+
     def update_button_positions(self):
         right_margin = 50
         button_spacing = 80  
@@ -179,8 +305,10 @@ class GasSimulator:
     def handle_resize(self, new_width: int, new_height: int):
         self.window_width = new_width
         self.window_height = new_height
+        self._box_cache = None
         self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
         self.update_button_positions()
+        self._rebuild_background()
         self.reposition_particles()
 
     def reposition_particles(self):
@@ -189,153 +317,171 @@ class GasSimulator:
         box_x = (self.window_width - box_width) // 2
         box_y = (self.window_height - box_height) // 2
         
-        for particle in self.particles:
-            #so particles dont move out of the box
-            particle.x = max(box_x + PARTICLE_RADIUS, 
-                           min(box_x + box_width - PARTICLE_RADIUS, particle.x))
-            particle.y = max(box_y + PARTICLE_RADIUS, 
-                           min(box_y + box_height - PARTICLE_RADIUS, particle.y))
+        #so particles dont move out of the box
+        np.clip(self.px, box_x + PARTICLE_RADIUS,
+                box_x + box_width - PARTICLE_RADIUS, out=self.px)
+        np.clip(self.py, box_y + PARTICLE_RADIUS,
+                box_y + box_height - PARTICLE_RADIUS, out=self.py)
 
     def get_box_dimensions(self):
-        box_width = min(self.window_width * self.box_scale, self.window_height * self.box_scale)
-        box_height = box_width * 0.75
-        box_x = (self.window_width - box_width) // 2
-        box_y = (self.window_height - box_height) // 2
-        return box_width, box_height, box_x, box_y
+        #called several times per frame, only changes on resize/box adjust
+        if self._box_cache is None:
+            box_width = min(self.window_width * self.box_scale, self.window_height * self.box_scale)
+            box_height = box_width * 0.75
+            box_x = (self.window_width - box_width) // 2
+            box_y = (self.window_height - box_height) // 2
+            self._box_cache = (box_width, box_height, box_x, box_y)
+        return self._box_cache
 
     def initialize_particles(self):
         box_width, box_height, box_x, box_y = self.get_box_dimensions()
         
-        for _ in range(NUM_PARTICLES):
-            x = random.uniform(box_x + PARTICLE_RADIUS, box_x + box_width - PARTICLE_RADIUS)
-            y = random.uniform(box_y + PARTICLE_RADIUS, box_y + box_height - PARTICLE_RADIUS)
-            self.particles.append(Particle(x, y))
+        #particle state as structure-of-arrays, drawn in bulk from the seeded rng
+        #float32 is plenty at pixel granularity and halves the bytes per ufunc
+        self.px = self.rng.uniform(box_x + PARTICLE_RADIUS, box_x + box_width - PARTICLE_RADIUS, NUM_PARTICLES).astype(np.float32)
+        self.py = self.rng.uniform(box_y + PARTICLE_RADIUS, box_y + box_height - PARTICLE_RADIUS, NUM_PARTICLES).astype(np.float32)
+        angle = self.rng.uniform(0, 2 * np.pi, NUM_PARTICLES)
+        speed = self.rng.uniform(MIN_SPEED, MAX_SPEED, NUM_PARTICLES)
+        self.vx = (speed * np.cos(angle)).astype(np.float32)
+        self.vy = (speed * np.sin(angle)).astype(np.float32)
 
     def adjust_box_size(self, change: float):
         old_scale = self.box_scale
-        self.box_scale = max(0.3, min(0.9, self.box_scale + change/1000))  
-        
+        self.box_scale = max(0.3, min(0.9, self.box_scale + change/1000))
+        self._box_cache = None
+
         old_width, old_height, old_x, old_y = self.get_box_dimensions()
         new_width, new_height, new_x, new_y = self.get_box_dimensions()
         
         #for maximizing the screen
-        for particle in self.particles:
-            rel_x = (particle.x - old_x) / old_width
-            rel_y = (particle.y - old_y) / old_height
-            
-            particle.x = new_x + rel_x * new_width
-            particle.y = new_y + rel_y * new_height
-            
-            particle.x = max(new_x + PARTICLE_RADIUS, min(new_x + new_width - PARTICLE_RADIUS, particle.x))
-            particle.y = max(new_y + PARTICLE_RADIUS, min(new_y + new_height - PARTICLE_RADIUS, particle.y))
+        rel_x = (self.px - old_x) / old_width
+        rel_y = (self.py - old_y) / old_height
+
+        self.px = new_x + rel_x * new_width
+        self.py = new_y + rel_y * new_height
+
+        np.clip(self.px, new_x + PARTICLE_RADIUS, new_x + new_width - PARTICLE_RADIUS, out=self.px)
+        np.clip(self.py, new_y + PARTICLE_RADIUS, new_y + new_height - PARTICLE_RADIUS, out=self.py)
+
+        self._rebuild_background()
 
     def adjust_temperature(self, change: float):
         self.temperature = max(0.1, min(2.0, self.temperature + change))
         factor = math.sqrt(self.temperature)
-        for particle in self.particles:
-            particle.set_speed(factor * MAX_SPEED)
-    
-    def calculate_average_speed(self) -> float:
-        return sum(p.get_speed() for p in self.particles) / len(self.particles)
-    
+        speed = np.hypot(self.vx, self.vy)
+        scale = factor * MAX_SPEED / np.where(speed == 0, 1.0, speed)
+        self.vx *= scale
+        self.vy *= scale
+
     def calculate_pressure(self) -> float:
+        #running sum so the 60-frame average is O(1) per frame
+        if len(self.pressure_history) == self.pressure_history.maxlen:
+            self._pressure_sum -= self.pressure_history[0]
         self.pressure_history.append(self.collisions)
-        if len(self.pressure_history) > 60:
-            self.pressure_history.pop(0)
-        return sum(self.pressure_history) / len(self.pressure_history)
+        self._pressure_sum += self.collisions
+        return self._pressure_sum / len(self.pressure_history)
     
-    def calculate_total_ke(self) -> float:
-        return sum(p.get_kinetic_energy() for p in self.particles)
-    
-    def calculate_average_ke(self) -> float:
-        return self.calculate_total_ke() / len(self.particles)
-    
-    def handle_collisions(self):
-        box_width, box_height, box_x, box_y = self.get_box_dimensions()
-        
-        for i, particle in enumerate(self.particles):
-            particle.x = max(box_x + PARTICLE_RADIUS, min(box_x + box_width - PARTICLE_RADIUS, particle.x))
-            particle.y = max(box_y + PARTICLE_RADIUS, min(box_y + box_height - PARTICLE_RADIUS, particle.y))
-            
-            #collision between particle n wall
-            if particle.x - PARTICLE_RADIUS <= box_x:
-                particle.dx = abs(particle.dx)
-                self.collisions += 1
-            elif particle.x + PARTICLE_RADIUS >= box_x + box_width:
-                particle.dx = -abs(particle.dx)
-                self.collisions += 1
-            
-            if particle.y - PARTICLE_RADIUS <= box_y:
-                particle.dy = abs(particle.dy)
-                self.collisions += 1
-            elif particle.y + PARTICLE_RADIUS >= box_y + box_height:
-                particle.dy = -abs(particle.dy)
-                self.collisions += 1
-                
-            #collision between aprticles
-            for j in range(i + 1, len(self.particles)):
-                other = self.particles[j]
-                dx = other.x - particle.x
-                dy = other.y - particle.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance < 2 * PARTICLE_RADIUS:
-                    angle = math.atan2(dy, dx)
-                    particle.dx, other.dx = other.dx, particle.dx
-                    particle.dy, other.dy = other.dy, particle.dy
-                    
-                    overlap = 2 * PARTICLE_RADIUS - distance
-                    particle.x -= overlap * math.cos(angle) / 2
-                    particle.y -= overlap * math.sin(angle) / 2
-                    other.x += overlap * math.cos(angle) / 2
-                    other.y += overlap * math.sin(angle) / 2
+    def move(self, x_min: float, x_max: float, y_min: float, y_max: float):
+        self.px += self.vx
+        self.py += self.vy
+
+        self.vx = np.where(self.px < x_min, np.abs(self.vx),
+                           np.where(self.px > x_max, -np.abs(self.vx), self.vx))
+        self.vy = np.where(self.py < y_min, np.abs(self.vy),
+                           np.where(self.py > y_max, -np.abs(self.vy), self.vy))
+        np.clip(self.px, x_min, x_max, out=self.px)
+        np.clip(self.py, y_min, y_max, out=self.py)
+
+    def _broadphase_pairs(self):
+        #uniform grid with cell size = collision distance, so candidates can
+        #only sit in the same cell or one of the 4 forward neighbours
+        cell_x = (self.px / COLLISION_DIST).astype(np.int32)
+        cell_y = (self.py / COLLISION_DIST).astype(np.int32)
+
+        grid = defaultdict(list)
+        for k in range(NUM_PARTICLES):
+            grid[(cell_x[k], cell_y[k])].append(k)
+
+        pairs_i = []
+        pairs_j = []
+        for (gx, gy), members in grid.items():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs_i.append(members[a])
+                    pairs_j.append(members[b])
+            for ox, oy in ((1, 0), (1, 1), (0, 1), (-1, 1)):
+                others = grid.get((gx + ox, gy + oy))
+                if others:
+                    for a in members:
+                        for b in others:
+                            pairs_i.append(a)
+                            pairs_j.append(b)
+
+        return np.asarray(pairs_i, dtype=np.intp), np.asarray(pairs_j, dtype=np.intp)
+
+    def handle_collisions(self, x_min: float, x_max: float, y_min: float, y_max: float):
+        np.clip(self.px, x_min, x_max, out=self.px)
+        np.clip(self.py, y_min, y_max, out=self.py)
+
+        #collision between particle n wall
+        hit_left = self.px <= x_min
+        hit_right = self.px >= x_max
+        hit_top = self.py <= y_min
+        hit_bottom = self.py >= y_max
+        #branchless, runs through numpy's vectorized where/abs kernels
+        self.vx = np.where(hit_left, np.abs(self.vx),
+                           np.where(hit_right, -np.abs(self.vx), self.vx))
+        self.vy = np.where(hit_top, np.abs(self.vy),
+                           np.where(hit_bottom, -np.abs(self.vy), self.vy))
+        self.collisions += int(hit_left.sum() + hit_right.sum()
+                               + hit_top.sum() + hit_bottom.sum())
+
+        #collision between aprticles, candidate pairs from the grid broadphase
+        i, j = self._broadphase_pairs()
+        if i.size:
+            dx = self.px[j] - self.px[i]
+            dy = self.py[j] - self.py[i]
+            #compare squared distances, only sqrt the few pairs that overlap
+            d_sq = dx**2 + dy**2
+            hit = d_sq < COLLISION_DIST_SQ
+            i = i[hit]
+            j = j[hit]
+            dx = dx[hit]
+            dy = dy[hit]
+
+        if i.size:
+            self.vx[i], self.vx[j] = self.vx[j].copy(), self.vx[i].copy()
+            self.vy[i], self.vy[j] = self.vy[j].copy(), self.vy[i].copy()
+
+            d = np.sqrt(d_sq[hit])
+            #coincident pairs (resize clamping can stack particles) separate
+            #along +x like the old atan2(0, 0) == 0 did, no division by zero
+            inv_d = 1.0 / np.where(d > 0, d, 1.0)
+            ux = np.where(d > 0, dx * inv_d, 1.0)
+            uy = dy * inv_d
+            overlap = COLLISION_DIST - d
+            self.px[i] -= overlap * ux / 2
+            self.py[i] -= overlap * uy / 2
+            self.px[j] += overlap * ux / 2
+            self.py[j] += overlap * uy / 2
+
+    def _render_text(self, text: str):
+        #stat strings repeat between frames, cache the rendered surfaces
+        surface = self._text_cache.get(text)
+        if surface is None:
+            if len(self._text_cache) >= 64:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            surface = self.font.render(text, True, BLACK).convert_alpha()
+            self._text_cache[text] = surface
+        return surface
+
+    def _render_stats(self, pressure: float):
+        #speed and KE share one pass over the velocity arrays
+        speed_sq = self.vx * self.vx + self.vy * self.vy
+        avg_speed = float(np.sqrt(speed_sq).mean())
+        total_ke = 0.5 * PARTICLE_MASS * float(speed_sq.sum())
+        avg_ke = total_ke / NUM_PARTICLES
 
-    def draw(self):
-        self.screen.fill(WHITE)  
-        
-        box_width, box_height, box_x, box_y = self.get_box_dimensions()
-        
-        shadow_rect = pygame.Rect(
-            box_x + CONTAINER_SHADOW_SIZE,
-            box_y + CONTAINER_SHADOW_SIZE,
-            box_width,
-            box_height
-        )
-        pygame.draw.rect(self.screen, CONTAINER_SHADOW, shadow_rect, border_radius=10)
-        
-        for i in range(WALL_THICKNESS):
-            border_rect = pygame.Rect(
-                box_x - i,
-                box_y - i,
-                box_width + 2*i,
-                box_height + 2*i
-            )
-            gradient_factor = 1 - (i / WALL_THICKNESS) * 0.3
-            border_color = (
-                int(CONTAINER_BORDER[0] * gradient_factor),
-                int(CONTAINER_BORDER[1] * gradient_factor),
-                int(CONTAINER_BORDER[2] * gradient_factor)
-            )
-            pygame.draw.rect(self.screen, border_color, border_rect, 1, border_radius=10)
-        
-        container_rect = pygame.Rect(box_x, box_y, box_width, box_height)
-        pygame.draw.rect(self.screen, CONTAINER_COLOR, container_rect, border_radius=10)
-        
-        for particle in self.particles:
-            for i in range(3):
-                glow_radius = PARTICLE_RADIUS + i
-                glow_color = (BLUE[0]//2, BLUE[1]//2, BLUE[2]//2)
-                pygame.draw.circle(self.screen, glow_color,
-                                 (int(particle.x), int(particle.y)), glow_radius)
-            
-            pygame.draw.circle(self.screen, BLUE, 
-                             (int(particle.x), int(particle.y)), PARTICLE_RADIUS)
-        
-        avg_speed = self.calculate_average_speed()
-        pressure = self.calculate_pressure()
-        avg_ke = self.calculate_average_ke()
-        total_ke = self.calculate_total_ke()
-        
         stats = [
             f"Average Speed: {avg_speed:.2f} {self.speed_unit}",
             f"Temperature: {self.temperature:.2f} {self.temp_unit} (×{self.temperature:.1f})",
@@ -343,10 +489,33 @@ class GasSimulator:
             f"Avg KE: {int(avg_ke)} {self.energy_unit}",
             f"Total KE: {int(total_ke)} {self.energy_unit}"
         ]
+
+        lines = [self._render_text(text) for text in stats]
+        width = max(line.get_width() for line in lines)
+        surface = pygame.Surface((width, (len(lines) - 1) * 40 + lines[-1].get_height()), pygame.SRCALPHA).convert_alpha()
+        for i, line in enumerate(lines):
+            surface.blit(line, (0, i * 40))
+        return surface
+
+    def draw(self):
+        self.screen.blit(self.background, (0, 0))
+
+        sprite = self.particle_sprite
+        #cast all coordinates to int in one numpy pass, tolist() batches in C
+        ix = (self.px - self.sprite_offset).astype(np.int32).tolist()
+        iy = (self.py - self.sprite_offset).astype(np.int32).tolist()
+        #one blits() call walks the whole list in C
+        self.screen.blits([(sprite, pos) for pos in zip(ix, iy)])
         
-        for i, text in enumerate(stats):
-            surface = self.font.render(text, True, BLACK)
-            self.screen.blit(surface, (10, 10 + i * 40))
+        #pressure window has to advance every frame, display lags behind
+        pressure = self.calculate_pressure()
+
+        #the numbers are unreadable at 60 Hz anyway, refresh the HUD at 10 Hz
+        self._stats_counter += 1
+        if self._stats_surface is None or self._stats_counter >= 6:
+            self._stats_counter = 0
+            self._stats_surface = self._render_stats(pressure)
+        self.screen.blit(self._stats_surface, (10, 10))
         
         # Draw buttons
         self.temp_up.draw(self.screen)
@@ -360,17 +529,12 @@ class GasSimulator:
     def run(self):
         running = True
         while running:
-            self.clock.tick(60)
+            dt = self.clock.tick(60) / 1000.0
             self.collisions = 0
-            
+
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.adjust_temperature(0.1)
-                    elif event.key == pygame.K_DOWN:
-                        self.adjust_temperature(-0.1)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     pos = pygame.mouse.get_pos()
                     if self.temp_up.is_clicked(pos):
@@ -383,15 +547,31 @@ class GasSimulator:
                         self.adjust_box_size(-20)
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event.w, event.h)
-            
-            #box size
+
+            #held arrows adjust at most once per frame, scaled by dt so the
+            #ramp rate is independent of frame rate and key-repeat settings
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_UP]:
+                self.adjust_temperature(TEMPERATURE_FACTOR * dt)
+            elif keys[pygame.K_DOWN]:
+                self.adjust_temperature(-TEMPERATURE_FACTOR * dt)
+
+            #wall bounds, computed once per frame
             box_width, box_height, box_x, box_y = self.get_box_dimensions()
-            
-            #move dlm box
-            for particle in self.particles:
-                particle.move(box_x, box_y, box_width, box_height)
-            
-            self.handle_collisions()
+            x_min = box_x + PARTICLE_RADIUS
+            x_max = box_x + box_width - PARTICLE_RADIUS
+            y_min = box_y + PARTICLE_RADIUS
+            y_max = box_y + box_height - PARTICLE_RADIUS
+
+            if _physics_step is not None:
+                self.collisions += _physics_step(
+                    self.px, self.py, self.vx, self.vy,
+                    x_min, x_max, y_min, y_max)
+            else:
+                #move dlm box
+                self.move(x_min, x_max, y_min, y_max)
+
+                self.handle_collisions(x_min, x_max, y_min, y_max)
             self.draw()
         
         pygame.quit()